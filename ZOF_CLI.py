@@ -13,135 +13,535 @@ Usage: python ZOF_CLI.py
 Interactive prompts will collect the equation and method parameters.
 """
 
+import ast
 import math
 import sys
-from typing import Callable, List, Tuple, Any
+from array import array
+from functools import lru_cache
+from typing import Callable, List, Tuple, Optional
+
+import numpy as np
 
 # ------------------ helper: parse expression ------------------
 
+# Names visible to user expressions; built once at import instead of per call.
+_MATH_NS = {k: v for k, v in vars(math).items() if not k.startswith("__")}
+_EVAL_GLOBALS = _MATH_NS | {"__builtins__": {}}
+
+# Array counterparts of the math names for the vectorized solvers. Only the
+# ufuncs below behave like their math namesakes (same arguments, same
+# results); every other math function is wrapped element-wise, since e.g.
+# np.remainder and np.log(x, out) differ from math.remainder and math.log.
+_NP_UFUNCS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan, "atan2": np.arctan2,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "asinh": np.arcsinh, "acosh": np.arccosh, "atanh": np.arctanh,
+    "exp": np.exp, "exp2": np.exp2, "expm1": np.expm1,
+    "log2": np.log2, "log10": np.log10, "log1p": np.log1p,
+    "sqrt": np.sqrt, "cbrt": np.cbrt, "fabs": np.fabs,
+    "degrees": np.degrees, "radians": np.radians, "copysign": np.copysign,
+}
+_NP_NS = {
+    k: _NP_UFUNCS[k] if k in _NP_UFUNCS
+    else np.vectorize(v, otypes=[np.float64]) if callable(v)
+    else v
+    for k, v in _MATH_NS.items()
+}
+_NP_EVAL_GLOBALS = _NP_NS | {"__builtins__": {}}
+
+
+# Users tend to resubmit the same f(x), g(x), f'(x) while tuning parameters,
+# so compiled code objects are kept across calls.
+@lru_cache(maxsize=256)
+def _compile_expr(expr: str):
+    try:
+        code = compile(expr, "<f>", "eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expr!r}: {e.msg}")
+    except (RecursionError, ValueError) as e:
+        raise ValueError(f"Invalid expression {expr!r}: {e}")
+    for c in code.co_consts:
+        if type(c) is int and not -2**1024 < c < 2**1024:
+            raise ValueError(f"Invalid expression {expr!r}: integer constant too large for a float")
+    return code
+
+
+_MAX_POLY_DEGREE = 64
+
+
+def _poly(node) -> Optional[dict]:
+    """{power: coeff} for an AST node that is a polynomial in x, else None."""
+    if isinstance(node, ast.Constant):
+        v = node.value
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            return {0: float(v)}
+        return None
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return {1: 1.0}
+        v = _MATH_NS.get(node.id)
+        return {0: v} if isinstance(v, float) else None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        p = _poly(node.operand)
+        if p is None or isinstance(node.op, ast.UAdd):
+            return p
+        return {k: -c for k, c in p.items()}
+    if not isinstance(node, ast.BinOp):
+        return None
+    if isinstance(node.op, ast.Pow):
+        # only x**n: expanding powers of sums would change the rounding
+        n = node.right.value if isinstance(node.right, ast.Constant) else None
+        if (isinstance(node.left, ast.Name) and node.left.id == "x"
+                and type(n) is int and 0 <= n <= _MAX_POLY_DEGREE):
+            return {n: 1.0}
+        return None
+    left, right = _poly(node.left), _poly(node.right)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = 1.0 if isinstance(node.op, ast.Add) else -1.0
+        out = dict(left)
+        for k, c in right.items():
+            out[k] = out.get(k, 0.0) + sign*c
+        return out
+    if isinstance(node.op, ast.Mult):
+        # at least one factor must be a single term, so no sums are expanded
+        if len(left) > 1 and len(right) > 1:
+            return None
+        out = {}
+        for k1, c1 in left.items():
+            for k2, c2 in right.items():
+                if k1 + k2 > _MAX_POLY_DEGREE:
+                    return None
+                out[k1+k2] = out.get(k1+k2, 0.0) + c1*c2
+        return out
+    if isinstance(node.op, ast.Div) and set(right) == {0} and right[0] != 0:
+        return {k: c/right[0] for k, c in left.items()}
+    return None
+
+
+@lru_cache(maxsize=256)
+def polynomial_coeffs(expr: str) -> Optional[Tuple[float, ...]]:
+    """Coefficients (highest power first) if expr is a polynomial in x, else None.
+
+    Only expanded forms such as 'x**3 - 2*x - 5' are recognised; products of
+    sums like '(x-1)**3' are left to the general evaluator.
+    """
+    try:
+        p = _poly(ast.parse(expr, mode="eval").body)
+    except (SyntaxError, OverflowError, RecursionError, ValueError):
+        # e.g. an int literal too big for a float, or a very long sum;
+        # the general evaluator decides what to do with those
+        return None
+    if p is None:
+        return None
+    return tuple(p.get(k, 0.0) for k in range(max(p), -1, -1))
+
+
+def _power(k: int) -> str:
+    return " * ".join(["x"] * k) if k <= 3 else f"x**{k}"
+
+
+def _horner_source(coeffs: Tuple[float, ...]) -> str:
+    """Unrolled Horner form of the polynomial, stepping over zero coefficients.
+
+    A gap of k zero coefficients becomes a single x**k, so sparse polynomials
+    such as x**40 - 1 cost no more than the expression itself.
+    """
+    n = len(coeffs) - 1
+    terms = [(n - k, c) for k, c in enumerate(coeffs) if c != 0.0]
+    if not terms:
+        return "0.0"
+    deg, lead = terms[0]
+    src = repr(lead)
+    for d, c in terms[1:]:
+        step = _power(deg - d)
+        src = step if src == "1.0" else f"({src}) * {step}"
+        src += f" - {-c!r}" if c < 0 else f" + {c!r}"
+        deg = d
+    if deg:
+        src = _power(deg) if src == "1.0" else f"({src}) * {_power(deg)}"
+    return src
+
+
+def horner(coeffs: Tuple[float, ...]) -> Callable[[float], float]:
+    """Return f(x) evaluating the polynomial with Horner's rule.
+
+    The evaluator is generated as straight-line code, so there is no loop over
+    coefficients at call time and no leading 0.0*x (which is nan at x=inf).
+    """
+    return eval(f"lambda x: {_horner_source(coeffs)}", _EVAL_GLOBALS)
+
+
 def make_f(expr: str) -> Callable[[float], float]:
-    """Return a function f(x) from a user expression. Allowed names: math.*"""
-    allowed = {k: getattr(math, k) for k in dir(math) if not k.startswith("__")}
-    def f(x):
-        try:
-            return eval(expr, {"__builtins__": {}}, {**allowed, "x": x})
-        except Exception as e:
-            raise ValueError(f"Error evaluating function at x={x}: {e}")
-    return f
+    """Return a function f(x) from a user expression. Allowed names: math.*
+
+    Polynomials are evaluated with Horner's rule; anything else is compiled
+    once and each call only executes the code object.
+    """
+    coeffs = polynomial_coeffs(expr)
+    if coeffs is not None:
+        return horner(coeffs)
+    code = _compile_expr(expr)
+    return lambda x, _c=code, _g=_EVAL_GLOBALS: eval(_c, _g, {"x": x})
+
+
+def make_f_vec(expr: str) -> Callable[[np.ndarray], np.ndarray]:
+    """Like make_f, but math names resolve to NumPy ufuncs so f accepts arrays.
+
+    Use this to build functions for bisection_vec / newton_raphson_vec.
+    """
+    code = _compile_expr(expr)
+    return lambda x, _c=code, _g=_NP_EVAL_GLOBALS: eval(_c, _g, {"x": x})
+
+
+# Node types a user expression may contain before it is turned into SymPy.
+_SAFE_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.UAdd, ast.USub,
+)
+
+
+def _expr_tree_ok(tree) -> bool:
+    """True if an expression AST is plain arithmetic on x, numbers and math names."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _SAFE_NODES):
+            return False
+        if isinstance(node, ast.Name) and node.id != "x" and node.id not in _MATH_NS:
+            return False
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            return False
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords):
+            return False
+    return True
+
+
+def _to_sympy(node, sympy, x):
+    """Build a SymPy expression from an AST that passed _expr_tree_ok."""
+    consts = {"x": x, "pi": sympy.pi, "e": sympy.E, "tau": 2*sympy.pi}
+    funcs = {
+        name: getattr(sympy, name)
+        for name in ("sin", "cos", "tan", "asin", "acos", "atan", "atan2",
+                     "sinh", "cosh", "tanh", "asinh", "acosh", "atanh",
+                     "exp", "sqrt", "erf", "erfc", "gamma")
+    }
+    funcs.update({
+        "log": lambda a, base=None: sympy.log(a) if base is None else sympy.log(a, base),
+        "log2": lambda a: sympy.log(a, 2),
+        "log10": lambda a: sympy.log(a, 10),
+        "log1p": lambda a: sympy.log(1 + a),
+        "expm1": lambda a: sympy.exp(a) - 1,
+        "pow": sympy.Pow,
+        "hypot": lambda a, b: sympy.sqrt(a**2 + b**2),
+    })
+    ops = {
+        ast.Add: lambda a, b: a + b,
+        ast.Sub: lambda a, b: a - b,
+        ast.Mult: lambda a, b: a * b,
+        ast.Div: lambda a, b: a / b,
+        ast.Pow: lambda a, b: a ** b,
+    }
+
+    def conv(n):
+        if isinstance(n, ast.Constant):
+            return sympy.Integer(n.value) if isinstance(n.value, int) else sympy.Float(n.value)
+        if isinstance(n, ast.Name):
+            return consts[n.id]
+        if isinstance(n, ast.UnaryOp):
+            v = conv(n.operand)
+            return -v if isinstance(n.op, ast.USub) else v
+        if isinstance(n, ast.BinOp):
+            return ops[type(n.op)](conv(n.left), conv(n.right))
+        return funcs[n.func.id](*(conv(arg) for arg in n.args))
+
+    return conv(node.body)
+
+
+@lru_cache(maxsize=128)
+def derivative_expr(expr: str) -> str:
+    """Return f'(x) for expr as an expression string, differentiated with SymPy.
+
+    The expression is checked and converted node by node; the raw string is
+    never passed to SymPy's parser. Raises ValueError if SymPy is unavailable
+    or the derivative cannot be written with x and math functions.
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expr!r}: {e.msg}")
+    if not _expr_tree_ok(tree):
+        raise ValueError(f"Cannot differentiate {expr!r}; enter f'(x) instead.")
+    try:
+        import sympy
+        from sympy.printing.pycode import pycode
+    except ImportError:
+        raise ValueError("Automatic derivatives need SymPy; enter f'(x) instead.")
+    x = sympy.Symbol("x", real=True)
+    try:
+        d = sympy.diff(_to_sympy(tree, sympy, x), x)
+        dexpr = pycode(d, fully_qualified_modules=False)
+        ok = _expr_tree_ok(ast.parse(dexpr, mode="eval"))
+    except Exception:
+        ok = False
+    if not ok:
+        raise ValueError(f"Cannot differentiate {expr!r}; enter f'(x) instead.")
+    return dexpr
 
 # ------------------ numerical methods ------------------
+# Bracket signs are compared directly rather than through f(a)*f(b), which
+# can overflow or underflow and lose the sign.
+
+def _same_sign(fa: float, fb: float) -> bool:
+    """True unless fa and fb are nonzero with opposite signs."""
+    return (fa > 0) == (fb > 0) or (fa < 0) == (fb < 0)
 
-def bisection(f: Callable, a: float, b: float, tol: float, max_iter: int):
-    if f(a) * f(b) >= 0:
+# Each solver returns (root, err, n_iter, iters). iters is a list of
+# array('d') columns, one value per iteration (the iteration number is
+# implicit); the columns stay empty when called with log=False, so use
+# n_iter for the iteration count.
+
+def _columns(n: int) -> List[array]:
+    return [array("d") for _ in range(n)]
+
+
+def bisection(f: Callable, a: float, b: float, tol: float, max_iter: int,
+              log: bool = True, rtol: float = 1e-12):
+    fa, fb = f(a), f(b)
+    if _same_sign(fa, fb):
         raise ValueError("f(a) and f(b) must have opposite signs for Bisection.")
-    iters = []
+    iters = _columns(5)
+    ap_a, ap_b, ap_c, ap_fc, ap_err = (col.append for col in iters)
+    local_abs = abs
     for i in range(1, max_iter+1):
         c = (a + b)/2.0
         fc = f(c)
-        err = abs(b-a)/2.0
-        iters.append((i, a, b, c, fc, err))
-        if abs(fc) < tol or err < tol:
-            return c, err, iters
-        if f(a) * fc < 0:
-            b = c
-        else:
-            a = c
-    return (a+b)/2.0, abs(b-a)/2.0, iters
+        err = local_abs(b-a)/2.0
+        if log:
+            ap_a(a)
+            ap_b(b)
+            ap_c(c)
+            ap_fc(fc)
+            ap_err(err)
+        if local_abs(fc) < tol or err < tol + rtol*local_abs(c):
+            return c, err, i, iters
+        # s is True when the root lies in [a, c]; select by indexing rather than
+        # branching (arithmetic blending would turn an inf f-value into nan).
+        s = (fa < 0) != (fc < 0)
+        a, fa = (c, a)[s], (fc, fa)[s]
+        b, fb = (b, c)[s], (fb, fc)[s]
+    return (a+b)/2.0, local_abs(b-a)/2.0, max_iter, iters
 
 
-def regula_falsi(f: Callable, a: float, b: float, tol: float, max_iter: int):
-    if f(a) * f(b) >= 0:
-        raise ValueError("f(a) and f(b) must have opposite signs for Regula Falsi.")
-    iters = []
+def regula_falsi(f: Callable, a: float, b: float, tol: float, max_iter: int,
+                 log: bool = True, rtol: float = 1e-12):
     fa, fb = f(a), f(b)
-    x_old = a
+    if _same_sign(fa, fb):
+        raise ValueError("f(a) and f(b) must have opposite signs for Regula Falsi.")
+    iters = _columns(5)
+    ap_a, ap_b, ap_x, ap_fx, ap_err = (col.append for col in iters)
+    local_abs = abs
+    x = x_old = a
+    err = math.inf
     for i in range(1, max_iter+1):
         x = (a*fb - b*fa)/(fb - fa)
         fx = f(x)
-        err = abs(x - x_old)
-        iters.append((i, a, b, x, fx, err))
-        if abs(fx) < tol or err < tol:
-            return x, err, iters
-        if fa * fx < 0:
+        err = local_abs(x - x_old)
+        if log:
+            ap_a(a)
+            ap_b(b)
+            ap_x(x)
+            ap_fx(fx)
+            ap_err(err)
+        if local_abs(fx) < tol or err < tol + rtol*local_abs(x):
+            return x, err, i, iters
+        if (fa < 0) != (fx < 0):
             b, fb = x, fx
         else:
             a, fa = x, fx
         x_old = x
-    return x, err, iters
+    return x, err, max_iter, iters
 
 
-def secant(f: Callable, x0: float, x1: float, tol: float, max_iter: int):
-    iters = []
+def secant(f: Callable, x0: float, x1: float, tol: float, max_iter: int,
+           log: bool = True, rtol: float = 1e-12):
+    iters = _columns(5)
+    ap_x0, ap_x1, ap_x2, ap_f2, ap_err = (col.append for col in iters)
+    local_abs = abs
+    x2, err = x1, math.inf
+    f0, f1 = f(x0), f(x1)
     for i in range(1, max_iter+1):
-        f0, f1 = f(x0), f(x1)
         if (f1 - f0) == 0:
             raise ValueError("Denominator zero in secant method.")
         x2 = x1 - f1*(x1-x0)/(f1-f0)
-        err = abs(x2 - x1)
-        iters.append((i, x0, x1, x2, f(x2), err))
-        if abs(f(x2)) < tol or err < tol:
-            return x2, err, iters
-        x0, x1 = x1, x2
-    return x2, err, iters
+        f2 = f(x2)
+        err = local_abs(x2 - x1)
+        if log:
+            ap_x0(x0)
+            ap_x1(x1)
+            ap_x2(x2)
+            ap_f2(f2)
+            ap_err(err)
+        if local_abs(f2) < tol or err < tol + rtol*local_abs(x2):
+            return x2, err, i, iters
+        x0, x1, f0, f1 = x1, x2, f1, f2
+    return x2, err, max_iter, iters
 
 
-def newton_raphson(f: Callable, df: Callable, x0: float, tol: float, max_iter: int):
-    iters = []
-    x = x0
+def newton_raphson(f: Callable, df: Callable, x0: float, tol: float, max_iter: int,
+                   log: bool = True, rtol: float = 1e-12):
+    iters = _columns(5)
+    ap_x, ap_fx, ap_dfx, ap_x_new, ap_err = (col.append for col in iters)
+    local_abs = abs
+    x, err = x0, math.inf
     for i in range(1, max_iter+1):
         fx = f(x)
         dfx = df(x)
         if dfx == 0:
             raise ValueError("Derivative is zero; Newton-Raphson fails.")
         x_new = x - fx/dfx
-        err = abs(x_new - x)
-        iters.append((i, x, fx, dfx, x_new, err))
-        if abs(fx) < tol or err < tol:
-            return x_new, err, iters
+        err = local_abs(x_new - x)
+        if log:
+            ap_x(x)
+            ap_fx(fx)
+            ap_dfx(dfx)
+            ap_x_new(x_new)
+            ap_err(err)
+        if local_abs(fx) < tol or err < tol + rtol*local_abs(x_new):
+            return x_new, err, i, iters
         x = x_new
-    return x, err, iters
+    return x, err, max_iter, iters
 
 
-def fixed_point(g: Callable, x0: float, tol: float, max_iter: int):
-    iters = []
-    x = x0
+def fixed_point(g: Callable, x0: float, tol: float, max_iter: int,
+                log: bool = True, rtol: float = 1e-12):
+    iters = _columns(3)
+    ap_x, ap_x_new, ap_err = (col.append for col in iters)
+    local_abs = abs
+    x, err = x0, math.inf
     for i in range(1, max_iter+1):
         x_new = g(x)
-        err = abs(x_new - x)
-        iters.append((i, x, x_new, err))
-        if err < tol:
-            return x_new, err, iters
+        err = local_abs(x_new - x)
+        if log:
+            ap_x(x)
+            ap_x_new(x_new)
+            ap_err(err)
+        if err < tol + rtol*local_abs(x_new):
+            return x_new, err, i, iters
         x = x_new
-    return x, err, iters
+    return x, err, max_iter, iters
 
 
-def modified_secant(f: Callable, x0: float, delta: float, tol: float, max_iter: int):
-    iters = []
-    x = x0
+def modified_secant(f: Callable, x0: float, delta: float, tol: float, max_iter: int,
+                    log: bool = True, rtol: float = 1e-12):
+    iters = _columns(4)
+    ap_x, ap_f_x, ap_x_new, ap_err = (col.append for col in iters)
+    local_abs = abs
+    x, err = x0, math.inf
     for i in range(1, max_iter+1):
         f_x = f(x)
         denom = f(x + delta*x) - f_x
         if denom == 0:
             raise ValueError("Denominator zero in modified secant (bad delta).")
         x_new = x - (delta * x * f_x) / denom
-        err = abs(x_new - x)
-        iters.append((i, x, f_x, x_new, err))
-        if abs(f_x) < tol or err < tol:
-            return x_new, err, iters
+        err = local_abs(x_new - x)
+        if log:
+            ap_x(x)
+            ap_f_x(f_x)
+            ap_x_new(x_new)
+            ap_err(err)
+        if local_abs(f_x) < tol or err < tol + rtol*local_abs(x_new):
+            return x_new, err, i, iters
         x = x_new
-    return x, err, iters
+    return x, err, max_iter, iters
+
+# ------------------ vectorized methods (batched initial guesses) ------------------
+
+def _as_vectorized(f: Callable, sample: np.ndarray) -> Tuple[Callable, np.ndarray]:
+    """Return (f, f(sample)) if f maps arrays to arrays, else an np.vectorize wrapper.
+
+    Functions from make_f_vec pass through; make_f functions get wrapped.
+    The evaluation at sample is returned so callers don't repeat it.
+    """
+    try:
+        out = np.asarray(f(sample), dtype=np.float64)
+        if out.shape == sample.shape:
+            return f, out
+    except (TypeError, ValueError, ArithmeticError):
+        pass
+    vf = np.vectorize(f, otypes=[np.float64])
+    return vf, vf(sample)
+
+
+def bisection_vec(f: Callable, a, b, tol: float, max_iter: int, rtol: float = 1e-12):
+    """Bisection on many brackets at once. a, b are arrays of equal shape.
+
+    Returns (roots, errors, iterations) with roots/errors as arrays.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    f, fa = _as_vectorized(f, a)
+    fb = f(b)
+    if np.any(((fa > 0) == (fb > 0)) | ((fa < 0) == (fb < 0))):
+        raise ValueError("f(a) and f(b) must have opposite signs for every bracket in Bisection.")
+    for i in range(1, max_iter+1):
+        c = 0.5*(a + b)
+        fc = f(c)
+        err = 0.5*np.abs(b - a)
+        if np.all((np.abs(fc) < tol) | (err < tol + rtol*np.abs(c))):
+            return c, err, i
+        left = (fa < 0) != (fc < 0)
+        b = np.where(left, c, b)
+        a = np.where(left, a, c)
+        fa = np.where(left, fa, fc)
+    return 0.5*(a + b), 0.5*np.abs(b - a), max_iter
+
+
+def newton_raphson_vec(f: Callable, df: Callable, x0, tol: float, max_iter: int, rtol: float = 1e-12):
+    """Newton-Raphson from many starting points at once. x0 is an array.
+
+    Converged entries are frozen while the rest keep iterating.
+    Returns (roots, errors, iterations) with roots/errors as arrays.
+    """
+    x = np.asarray(x0, dtype=np.float64)
+    f, fx = _as_vectorized(f, x)
+    df, dfx = _as_vectorized(df, x)
+    err = np.full(x.shape, np.inf)
+    done = np.zeros(x.shape, dtype=bool)
+    for i in range(1, max_iter+1):
+        if i > 1:
+            fx = f(x)
+            dfx = df(x)
+        if np.any((dfx == 0) & ~done):
+            raise ValueError("Derivative is zero; Newton-Raphson fails.")
+        step = np.where(done, 0.0, fx / np.where(dfx == 0, 1.0, dfx))
+        x_new = x - step
+        err = np.where(done, err, np.abs(step))
+        done |= (np.abs(fx) < tol) | (err < tol + rtol*np.abs(x_new))
+        x = x_new
+        if np.all(done):
+            return x, err, i
+    return x, err, max_iter
 
 # ------------------ CLI interface ------------------
 
-def print_iter_table(rows: List[Tuple[Any, ...]]):
-    for r in rows:
-        print(" | ".join(str(x) for x in r))
+def print_iter_table(cols: List[array]):
+    if not cols or not cols[0]:
+        return
+    # one format string for the whole table: iteration number, then floats
+    fmt = " | ".join(["{}"] + ["{:.6g}"] * len(cols)) + "\n"
+    rows = zip(range(1, len(cols[0]) + 1), *cols)
+    sys.stdout.write("".join(fmt.format(*r) for r in rows))
 
 
 def main():
     print("ZOF CLI - Root finding methods")
     expr = input("Enter function f(x) (use 'x' and math functions, e.g. 'x**3 - 2*x -5'): ")
-    f = make_f(expr)
+    try:
+        f = make_f(expr)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
     print("Choose method:\n1 Bisection\n2 Regula Falsi\n3 Secant\n4 Newton-Raphson\n5 Fixed Point\n6 Modified Secant")
     choice = input("Method number: ")
     tol = float(input("Tolerance (e.g. 1e-6): ") or 1e-6)
@@ -151,39 +551,42 @@ def main():
         if choice == '1':
             a = float(input("a: "))
             b = float(input("b: "))
-            root, err, iters = bisection(f, a, b, tol, max_iter)
+            root, err, n_iter, iters = bisection(f, a, b, tol, max_iter)
             print_iter_table(iters)
         elif choice == '2':
             a = float(input("a: "))
             b = float(input("b: "))
-            root, err, iters = regula_falsi(f, a, b, tol, max_iter)
+            root, err, n_iter, iters = regula_falsi(f, a, b, tol, max_iter)
             print_iter_table(iters)
         elif choice == '3':
             x0 = float(input("x0: "))
             x1 = float(input("x1: "))
-            root, err, iters = secant(f, x0, x1, tol, max_iter)
+            root, err, n_iter, iters = secant(f, x0, x1, tol, max_iter)
             print_iter_table(iters)
         elif choice == '4':
-            dexpr = input("Enter derivative f'(x) (e.g. '3*x**2 - 2'): ")
+            dexpr = input("Enter derivative f'(x) (e.g. '3*x**2 - 2', blank to compute it): ").strip()
+            if dexpr == '':
+                dexpr = derivative_expr(expr)
+                print(f"f'(x) = {dexpr}")
             df = make_f(dexpr)
             x0 = float(input("Initial x0: "))
-            root, err, iters = newton_raphson(f, df, x0, tol, max_iter)
+            root, err, n_iter, iters = newton_raphson(f, df, x0, tol, max_iter)
             print_iter_table(iters)
         elif choice == '5':
             gexpr = input("Enter iteration function g(x) (so that x = g(x)): ")
             g = make_f(gexpr)
             x0 = float(input("Initial x0: "))
-            root, err, iters = fixed_point(g, x0, tol, max_iter)
+            root, err, n_iter, iters = fixed_point(g, x0, tol, max_iter)
             print_iter_table(iters)
         elif choice == '6':
             x0 = float(input("Initial x0: "))
             delta = float(input("Delta (relative perturbation, e.g. 1e-3): ") or 1e-3)
-            root, err, iters = modified_secant(f, x0, delta, tol, max_iter)
+            root, err, n_iter, iters = modified_secant(f, x0, delta, tol, max_iter)
             print_iter_table(iters)
         else:
             print("Unknown choice")
             return
-        print(f"\nEstimated root: {root}\nFinal estimated error: {err}\nIterations: {len(iters)}")
+        print(f"\nEstimated root: {root}\nFinal estimated error: {err}\nIterations: {n_iter}")
     except Exception as e:
         print(f"Error: {e}")
 
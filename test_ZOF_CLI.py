@@ -0,0 +1,171 @@
+import math
+import os
+
+import numpy as np
+import pytest
+
+from ZOF_CLI import (_EVAL_GLOBALS, _NP_NS, _as_vectorized, _compile_expr, bisection, bisection_vec,
+                     derivative_expr, make_f, make_f_vec, newton_raphson, newton_raphson_vec,
+                     polynomial_coeffs)
+
+# A string literal passed to a SymPy function is re-parsed with eval, so it
+# must never reach SymPy.
+PAYLOAD = "sin(\"__import__('os').environ.__setitem__('ZOF_PAYLOAD', '1') or 1\") + x"
+
+
+def test_derivative_expr_polynomial():
+    assert derivative_expr("x**3 - 2*x - 5") == "3*x**2 - 2"
+
+
+def test_derivative_expr_rejects_string_literal(monkeypatch):
+    monkeypatch.delenv("ZOF_PAYLOAD", raising=False)
+    with pytest.raises(ValueError):
+        derivative_expr(PAYLOAD)
+    assert "ZOF_PAYLOAD" not in os.environ
+
+
+def test_newton_route_rejects_string_literal(monkeypatch):
+    pytest.importorskip("flask")
+    from app import app
+
+    monkeypatch.delenv("ZOF_PAYLOAD", raising=False)
+    resp = app.test_client().post("/", data={
+        "expr": PAYLOAD, "method": "newton", "x0": "1", "dexpr": "",
+        "tol": "1e-6", "max_iter": "50",
+    })
+    assert resp.status_code == 200
+    assert "Cannot differentiate" in resp.get_data(as_text=True)
+    assert "ZOF_PAYLOAD" not in os.environ
+
+
+# ------------------ vectorized solvers ------------------
+
+def cubic(x):
+    return x**3 - 2*x - 5
+
+
+def dcubic(x):
+    return 3*x**2 - 2
+
+
+def test_as_vectorized_wraps_scalar_function():
+    f = make_f("sin(x) - 0.5")
+    sample = np.array([0.0, 1.0, 2.0])
+    vf, out = _as_vectorized(f, sample)
+    assert isinstance(vf, np.vectorize)
+    np.testing.assert_allclose(out, [f(v) for v in sample])
+
+
+def test_as_vectorized_passes_array_function_through():
+    sample = np.array([1.0, 2.0])
+    vf, out = _as_vectorized(cubic, sample)
+    assert vf is cubic
+    np.testing.assert_array_equal(out, cubic(sample))
+
+
+def test_bisection_vec_matches_scalar():
+    a, b = [1.0, 0.0, 2.0], [3.0, 4.0, 2.5]
+    roots, errs, n = bisection_vec(make_f("sin(x) + x**3 - 2*x - 5"), a, b, 1e-10, 200)
+    f = make_f("sin(x) + x**3 - 2*x - 5")
+    for ai, bi, r in zip(a, b, roots):
+        np.testing.assert_allclose(r, bisection(f, ai, bi, 1e-10, 200)[0], atol=1e-9)
+    assert n == max(bisection(f, ai, bi, 1e-10, 200)[2] for ai, bi in zip(a, b))
+
+
+def test_bisection_vec_rejects_batch_with_one_bad_bracket():
+    with pytest.raises(ValueError):
+        bisection_vec(cubic, [1.0, 2.5], [3.0, 3.0], 1e-10, 100)
+
+
+def test_newton_vec_freezes_converged_entries():
+    # Newton converges linearly on a double root, so any extra step would
+    # still move an entry that has already converged
+    f = lambda x: (x - 1)**2
+    df = lambda x: 2*(x - 1)
+    x0 = [1.5, 10.0, 100.0]
+    roots, errs, n = newton_raphson_vec(f, df, x0, 1e-6, 100)
+    counts = []
+    for i, xi in enumerate(x0):
+        root, err, k, _ = newton_raphson(f, df, xi, 1e-6, 100)
+        np.testing.assert_allclose(roots[i], root, rtol=1e-14)
+        np.testing.assert_allclose(errs[i], err, rtol=1e-12)
+        counts.append(k)
+    assert counts[0] < n == max(counts)
+
+
+def test_vec_solvers_with_max_iter_zero():
+    roots, errs, n = bisection_vec(cubic, [1.0, 0.0], [3.0, 4.0], 1e-10, 0)
+    np.testing.assert_array_equal(roots, [2.0, 2.0])
+    assert n == 0
+    roots, errs, n = newton_raphson_vec(cubic, dcubic, [2.0, 3.0], 1e-10, 0)
+    np.testing.assert_array_equal(roots, [2.0, 3.0])
+    assert np.all(np.isinf(errs)) and n == 0
+
+
+# ------------------ NumPy expression namespace ------------------
+
+@pytest.mark.parametrize("expr", [
+    "sin(x) + cos(2*x)", "log10(x)", "atan2(x, 2)", "sqrt(x) * pi",
+    "log(x, 2)", "remainder(x, 3)", "hypot(x, 1)", "factorial(3) * x",
+])
+def test_make_f_vec_matches_make_f(expr):
+    arr = np.array([0.5, 1.0, 2.5, 5.0, 7.25])
+    np.testing.assert_allclose(make_f_vec(expr)(arr), [make_f(expr)(v) for v in arr], rtol=1e-15)
+
+
+def test_np_namespace_uses_ufuncs_only_where_semantics_match():
+    assert _NP_NS["sin"] is np.sin
+    assert _NP_NS["atan2"] is np.arctan2
+    for name in ("log", "remainder", "hypot", "fsum"):
+        assert isinstance(_NP_NS[name], np.vectorize)
+
+
+# ------------------ polynomial specialization ------------------
+
+def _eval_f(expr):
+    code = _compile_expr(expr)
+    return lambda x: eval(code, _EVAL_GLOBALS, {"x": x})
+
+
+@pytest.mark.parametrize("expr, coeffs", [
+    ("x**3 - 2*x - 5", (1.0, 0.0, -2.0, -5.0)),
+    ("x*x*x", (1.0, 0.0, 0.0, 0.0)),
+    ("-x**2", (-1.0, 0.0, 0.0)),
+    ("x/3", (1/3, 0.0)),
+])
+def test_polynomial_coeffs_accepts(expr, coeffs):
+    assert polynomial_coeffs(expr) == coeffs
+
+
+@pytest.mark.parametrize("expr", ["(x-1)**3", "x**2.0", "2**x", "sin(x)", "x**", "x + " * 3000 + "x",
+                                  "x + 1" + "0" * 400])
+def test_polynomial_coeffs_rejects(expr):
+    assert polynomial_coeffs(expr) is None
+
+
+@pytest.mark.parametrize("expr", ["x - 1", "x**2 + 1", "-x**2/2 + 3", "x**3 - 2*x - 5",
+                                  "x**40 - 1", "2*x**5 - 3*x**2 + x - 7"])
+def test_make_f_polynomial_matches_eval(expr):
+    f, g = make_f(expr), _eval_f(expr)
+    for x in (-2.5, -1.0, 0.0, 0.3, 1.0, 1.7):
+        assert f(x) == pytest.approx(g(x), rel=1e-12, abs=1e-12)
+
+
+# Written out term by term, x**3 - 2*x is inf - inf at x = inf; Horner's form
+# gives the limit instead.
+@pytest.mark.parametrize("expr, at_inf, at_minus_inf", [
+    ("x - 1", math.inf, -math.inf),
+    ("x**2 + 1", math.inf, math.inf),
+    ("-x**2/2 + 3", -math.inf, -math.inf),
+    ("x**3 - 2*x - 5", math.inf, -math.inf),
+    ("x**40 - 1", math.inf, math.inf),
+])
+def test_make_f_polynomial_at_infinity(expr, at_inf, at_minus_inf):
+    f = make_f(expr)
+    assert (f(math.inf), f(-math.inf)) == (at_inf, at_minus_inf)
+
+
+@pytest.mark.parametrize("expr", ["x**", "x + " * 3000 + "x", "x + 1" + "0" * 400])
+def test_make_f_invalid_or_huge_raises_value_error(expr):
+    with pytest.raises(ValueError):
+        make_f(expr)